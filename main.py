@@ -1,60 +1,273 @@
+import asyncio
 import json
 import os
 import re
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
 from astrbot.api.event import filter, AstrMessageEvent
 from astrbot.api.star import Context, Star, register
 
+try:
+    import orjson
+except ImportError:  # 未安装orjson时退回标准库json
+    orjson = None
+
 # === 全局配置 ===
 PLUGIN_DIR = os.path.join(os.path.dirname(__file__), "data")
-TASKS_FILE = os.path.join(PLUGIN_DIR, "tasks.json")
+DB_FILE = os.path.join(PLUGIN_DIR, "tasks.db")
+TASKS_FILE = os.path.join(PLUGIN_DIR, "tasks.json")  # 旧版数据文件，首次启动时导入数据库
 POINTS_FILE = os.path.join(PLUGIN_DIR, "points.json")
 ADMIN_IDS = "2195556927"  # 管理员用户ID（用逗号分隔）
 TASK_PERMISSION_MODE = 0  # 发布任务选项 0=所有人可发布 1=仅管理员发布
+MESSAGE_CHUNK_SIZE = 20  # 任务列表单条消息最多包含的任务数
 
 # === 初始化处理 ===
 admin_list = [uid.strip() for uid in ADMIN_IDS.split(",") if uid.strip()]
 os.makedirs(PLUGIN_DIR, exist_ok=True)
 
+class TaskStatus(IntEnum):
+    """任务状态（内存中使用整数，数据库中仍保存为字符串）"""
+    PENDING = 0
+    ACCEPTED = 1
+    PENDING_REVIEW = 2
+    COMPLETED = 3
+
+# 状态在数据库/旧版数据文件中的名称，按TaskStatus取值索引
+_STATUS_NAME = ("pending", "accepted", "pending_review", "completed")
+_STATUS_BY_NAME = {name: TaskStatus(i) for i, name in enumerate(_STATUS_NAME)}
+
+# 任务状态标签，按TaskStatus取值索引（顺序与任务列表分组一致）
+_STATUS_LABEL = ("待接受", "进行中", "待审核", "已完成")
+
+@dataclass(slots=True)
+class Task:
+    """任务记录（列表展示用不到的字段带默认值，查询可只选部分列）"""
+    task_id: str
+    publisher_name: str
+    content: str
+    status: TaskStatus
+    publisher_id: str = ""
+    publish_time: str = ""
+    accepted_by_id: Optional[str] = None
+    accepted_by_name: Optional[str] = None
+
+    @staticmethod
+    def from_row(cursor: sqlite3.Cursor, row: tuple) -> "Task":
+        """作为row_factory使用，按查询的列名构造"""
+        task = Task(**{col[0]: value for col, value in zip(cursor.description, row)})
+        task.status = _STATUS_BY_NAME.get(task.status, task.status)
+        return task
+
+@dataclass(slots=True)
+class UserPoints:
+    """用户积分记录（字段顺序与points表一致）"""
+    user_id: str
+    name: Optional[str]
+    points: int
+
+    @staticmethod
+    def from_row(cursor: sqlite3.Cursor, row: tuple) -> "UserPoints":
+        """作为row_factory使用，查询需按_POINTS_COLUMNS选列"""
+        return UserPoints(*row)
+
+_TASK_COLUMNS = (
+    "task_id, publisher_id, publisher_name, content, "
+    "publish_time, status, accepted_by_id, accepted_by_name"
+)
+_POINTS_COLUMNS = "user_id, name, points"
+
+# 任务列表条目模板（预先绑定format，循环中直接调用）
+_TASK_ITEM_FMT = "ID：{task_id}\n内容：{content}\n发布者：{publisher}\n状态：{status}".format
+_MY_TASK_ITEM_FMT = "{type} - {status}\nID：{task_id}\n内容：{content}\n————————————".format
+
+# 任务ID格式：月份(01-12)+日期(01-31)+序号(3位)
+_TASK_ID_RE = re.compile(r"(?:0[1-9]|1[0-2])(?:0[1-9]|[12][0-9]|3[01])[0-9]{3}")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    publisher_id TEXT NOT NULL,
+    publisher_name TEXT NOT NULL,
+    content TEXT NOT NULL,
+    publish_time TEXT NOT NULL,
+    status TEXT NOT NULL,
+    accepted_by_id TEXT,
+    accepted_by_name TEXT
+);
+-- 我的任务按发布者/执行者查询，只读取相关行
+CREATE INDEX IF NOT EXISTS idx_tasks_publisher ON tasks (publisher_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_acceptor ON tasks (accepted_by_id);
+CREATE TABLE IF NOT EXISTS points (
+    user_id TEXT PRIMARY KEY,
+    name TEXT,
+    points INTEGER NOT NULL DEFAULT 0
+);
+-- 积分榜按索引顺序读取前10名，无需全表排序
+CREATE INDEX IF NOT EXISTS idx_points_rank ON points (points DESC);
+"""
+
+# 写入数据库时TaskStatus自动转为状态字符串
+sqlite3.register_adapter(TaskStatus, lambda status: _STATUS_NAME[status])
+
+def _row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict:
+    """查询结果转为字典，状态字符串转为TaskStatus（未知状态保持原样）"""
+    data = {col[0]: value for col, value in zip(cursor.description, row)}
+    if "status" in data:
+        data["status"] = _STATUS_BY_NAME.get(data["status"], data["status"])
+    return data
+
+def open_db(file_path: str) -> sqlite3.Connection:
+    """打开数据库（WAL模式）并建表"""
+    db = sqlite3.connect(file_path, isolation_level=None, check_same_thread=False)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.executescript(_SCHEMA)
+    db.row_factory = _row_factory
+    return db
+
+@contextmanager
+def transaction(db: sqlite3.Connection):
+    """在单个事务中执行多条写操作（开始时即获取写锁）"""
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+        db.execute("COMMIT")
+    except BaseException:
+        # COMMIT失败时同样回滚，避免连接停留在未结束的事务中
+        if db.in_transaction:
+            db.execute("ROLLBACK")
+        raise
+
+def _truncate(text: str, limit: int) -> str:
+    """截断过长文本，超出部分以...表示"""
+    return text[:limit] + "..." if len(text) > limit else text
+
 def load_data(file_path: str) -> List[Dict]:
     """加载JSON数据文件"""
     if not os.path.exists(file_path):
         return []
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
 
-def save_data(data: List[Dict], file_path: str):
-    """保存数据到JSON文件"""
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-def migrate_old_data():
-    """数据迁移：兼容旧版数据结构"""
+def migrate_old_data(db: sqlite3.Connection):
+    """数据迁移：兼容旧版数据结构，并将旧版JSON数据导入数据库"""
     tasks = load_data(TASKS_FILE)
-    updated = False
+    points = load_data(POINTS_FILE)
     
     for task in tasks:
         if "accepted_by" in task and "accepted_by_id" not in task:
             task["accepted_by_id"] = task["accepted_by"]
             task["accepted_by_name"] = "历史用户"
             del task["accepted_by"]
-            updated = True
         
         if "publisher_name" not in task:
             task["publisher_name"] = "历史发布者"
-            updated = True
-            
-    if updated:
-        save_data(tasks, TASKS_FILE)
+
+    with transaction(db):
+        db.executemany(
+            "INSERT OR IGNORE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(
+                t["task_id"], t["publisher_id"], t["publisher_name"],
+                t["content"], t.get("publish_time", ""), t.get("status", "pending"),
+                t.get("accepted_by_id"), t.get("accepted_by_name")
+            ) for t in tasks]
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO points VALUES (?, ?, ?)",
+            [(p["user_id"], p.get("name"), p.get("points", 0)) for p in points]
+        )
+
+    # 导入完成后保留备份，避免重复导入
+    for file_path in (TASKS_FILE, POINTS_FILE):
+        if os.path.exists(file_path):
+            os.replace(file_path, file_path + ".bak")
 
 # === 任务系统核心 ===
 @register("task_system", "Developer", "任务管理系统", "1.0")
 class AdvancedTaskSystem(Star):
     def __init__(self, context: Context):
         super().__init__(context)
-        migrate_old_data()
+        self._db = open_db(DB_FILE)
+        migrate_old_data(self._db)
+        # 数据库操作统一在单独线程中串行执行，避免阻塞事件循环
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task_system_db")
         self.admin_ids = admin_list
+        self._admin_mentions = " ".join(f"@{uid}" for uid in self.admin_ids)
+        self._day_counters: Dict[str, int] = {}  # MMDD -> 当日最大序号
+        for row in self._db.execute("SELECT task_id FROM tasks"):
+            task_id = row["task_id"]
+            if len(task_id) == 7 and task_id[4:].isdigit():
+                date_str, serial = task_id[:4], int(task_id[4:])
+                if serial > self._day_counters.get(date_str, 0):
+                    self._day_counters[date_str] = serial
+
+    async def terminate(self):
+        """插件卸载时关闭数据库"""
+        await self._run(self._db.close)
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable, *args) -> Any:
+        """在数据库线程中执行func"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _fetch(self, sql: str, params: tuple = (), row_factory: Optional[Callable] = None) -> List:
+        """执行查询并返回全部结果，可指定本次查询的row_factory"""
+        cursor = self._db.cursor()
+        if row_factory:
+            cursor.row_factory = row_factory
+        return cursor.execute(sql, params).fetchall()
+
+    def _execute(self, sql: str, params: tuple = ()) -> int:
+        """执行写操作并返回受影响的行数"""
+        return self._db.execute(sql, params).rowcount
+
+    def _submit_task(self, task_id: str, user_id: str) -> Optional[Dict]:
+        """将用户本人进行中的任务提交审核，返回任务（不存在时为None）"""
+        task = self._db.execute(
+            "SELECT accepted_by_id FROM tasks WHERE task_id = ? AND status = ?",
+            (task_id, TaskStatus.ACCEPTED)
+        ).fetchone()
+        if task and task["accepted_by_id"] == user_id:
+            self._db.execute(
+                "UPDATE tasks SET status = ? WHERE task_id = ?",
+                (TaskStatus.PENDING_REVIEW, task_id)
+            )
+        return task
+
+    def _approve_task(self, task_id: str) -> Optional[Dict]:
+        """审核通过任务并为执行者加1积分，返回任务及执行者当前积分"""
+        # 查询、状态更新与积分更新在同一事务内完成
+        with transaction(self._db):
+            target_task = self._db.execute(
+                "SELECT publisher_name, accepted_by_id, accepted_by_name "
+                "FROM tasks WHERE task_id = ? AND status = ?",
+                (task_id, TaskStatus.PENDING_REVIEW)
+            ).fetchone()
+            if not target_task:
+                return None
+                
+            completer_id = target_task["accepted_by_id"]
+            self._db.execute(
+                "UPDATE tasks SET status = ? WHERE task_id = ?",
+                (TaskStatus.COMPLETED, task_id)
+            )
+            # 更新积分
+            self._db.execute(
+                "INSERT INTO points (user_id, name, points) VALUES (?, ?, 1) "
+                "ON CONFLICT(user_id) DO UPDATE SET points = points + 1",
+                (completer_id, target_task["accepted_by_name"])
+            )
+            target_task["points"] = self._db.execute(
+                "SELECT points FROM points WHERE user_id = ?", (completer_id,)
+            ).fetchone()["points"]
+        return target_task
 
     def _get_user_info(self, event: AstrMessageEvent) -> Dict:
         """获取用户信息"""
@@ -63,31 +276,14 @@ class AdvancedTaskSystem(Star):
             "name": event.get_sender_name() or "未知用户"
         }
 
-    def _generate_task_id(self) -> str:
+    def _generate_task_id(self, now: Optional[datetime] = None) -> str:
         """生成MMDD+序号格式的任务ID（示例：0715001）"""
-        date_str = datetime.now().strftime("%m%d")
-        tasks = load_data(TASKS_FILE)
-        
-        same_day_tasks = [
-            t for t in tasks 
-            if t["task_id"].startswith(date_str) 
-            and len(t["task_id"]) == 7
-            and t["task_id"][4:].isdigit()
-        ]
-        max_serial = max(
-            (int(t["task_id"][4:]) for t in same_day_tasks),
-            default=0
-        )
-        return f"{date_str}{max_serial + 1:03d}"
+        date_str = (now or datetime.now()).strftime("%m%d")
+        return f"{date_str}{self._day_counters.get(date_str, 0) + 1:03d}"
 
     def _validate_task_id(self, task_id: str) -> bool:
         """校验任务ID格式"""
-        return (
-            len(task_id) == 7 and
-            task_id.isdigit() and
-            1 <= int(task_id[:2]) <= 12 and
-            1 <= int(task_id[2:4]) <= 31
-        )
+        return _TASK_ID_RE.fullmatch(task_id) is not None
 
     # === 任务发布模块 ===
     @filter.command("发布任务")
@@ -98,22 +294,20 @@ class AdvancedTaskSystem(Star):
             yield event.plain_result("❌ 仅管理员可发布任务")
             return
 
-        tasks = load_data(TASKS_FILE)
-        task_id = self._generate_task_id()
-        
-        new_task = {
-            "task_id": task_id,
-            "publisher_id": user["id"],
-            "publisher_name": user["name"],
-            "content": content,
-            "publish_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "status": "pending",
-            "accepted_by_id": None,
-            "accepted_by_name": None
-        }
+        now = datetime.now()
+        task_id = self._generate_task_id(now)
+        # 等待写入前先占用序号，避免并发发布生成重复ID
+        self._day_counters[task_id[:4]] = int(task_id[4:])
         
-        tasks.append(new_task)
-        save_data(tasks, TASKS_FILE)
+        await self._run(
+            self._execute,
+            "INSERT INTO tasks (task_id, publisher_id, publisher_name, content, "
+            "publish_time, status) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                task_id, user["id"], user["name"], content,
+                now.strftime("%Y-%m-%d %H:%M:%S"), TaskStatus.PENDING
+            )
+        )
         
         yield event.plain_result(
             f"📌 新任务已创建\n"
@@ -129,19 +323,17 @@ class AdvancedTaskSystem(Star):
             return
         
         user = self._get_user_info(event)
-        tasks = load_data(TASKS_FILE)
-        
-        for task in tasks:
-            if task["task_id"] == task_id and task["status"] == "pending":
-                task.update({
-                    "status": "accepted",
-                    "accepted_by_id": user["id"],
-                    "accepted_by_name": user["name"]
-                })
-                save_data(tasks, TASKS_FILE)
-                yield event.plain_result(f"✅ 已接受任务 {task_id}")
-                return
-        yield event.plain_result("❌ 任务不可接受")
+        updated = await self._run(
+            self._execute,
+            "UPDATE tasks SET status = ?, accepted_by_id = ?, accepted_by_name = ? "
+            "WHERE task_id = ? AND status = ?",
+            (TaskStatus.ACCEPTED, user["id"], user["name"], task_id, TaskStatus.PENDING)
+        )
+        if not updated:
+            yield event.plain_result("❌ 任务不可接受")
+            return
+
+        yield event.plain_result(f"✅ 已接受任务 {task_id}")
 
     # === 任务完成模块 ===
     @filter.command("完成任务")
@@ -152,26 +344,21 @@ class AdvancedTaskSystem(Star):
             return
         
         user = self._get_user_info(event)
-        tasks = load_data(TASKS_FILE)
+        task = await self._run(self._submit_task, task_id, user["id"])
+        if not task:
+            yield event.plain_result("❌ 无效任务ID")
+            return
+
+        if task["accepted_by_id"] != user["id"]:
+            yield event.plain_result("❌ 这不是你的任务")
+            return
         
-        for task in tasks:
-            if task["task_id"] == task_id and task["status"] == "accepted":
-                if task["accepted_by_id"] != user["id"]:
-                    yield event.plain_result("❌ 这不是你的任务")
-                    return
-                
-                task["status"] = "pending_review"
-                save_data(tasks, TASKS_FILE)
-                
-                admin_mentions = " ".join([f"@{uid}" for uid in self.admin_ids])
-                yield event.plain_result(
-                    f"📢 任务完成待审核\n"
-                    f"任务ID：{task_id}\n"
-                    f"执行人：{user['name']}\n"
-                    f"{admin_mentions} 请及时审核"
-                )
-                return
-        yield event.plain_result("❌ 无效任务ID")
+        yield event.plain_result(
+            f"📢 任务完成待审核\n"
+            f"任务ID：{task_id}\n"
+            f"执行人：{user['name']}\n"
+            f"{self._admin_mentions} 请及时审核"
+        )
 
     # === 任务审核模块 ===
     @filter.command("审核任务")
@@ -186,45 +373,16 @@ class AdvancedTaskSystem(Star):
             yield event.plain_result("⛔ 需要管理员权限")
             return
 
-        tasks = load_data(TASKS_FILE)
-        points = load_data(POINTS_FILE)
-        
-        target_task = next(
-            (t for t in tasks 
-             if t["task_id"] == task_id 
-             and t["status"] == "pending_review"), 
-            None
-        )
-        
+        target_task = await self._run(self._approve_task, task_id)
         if not target_task:
             yield event.plain_result("❌ 无效的任务ID")
             return
-            
-        target_task["status"] = "completed"
-        completer_id = target_task["accepted_by_id"]
-        
-        # 更新积分
-        user_points = next(
-            (p for p in points if p["user_id"] == completer_id),
-            None
-        )
-        if not user_points:
-            user_points = {
-                "user_id": completer_id,
-                "name": target_task["accepted_by_name"],
-                "points": 0
-            }
-            points.append(user_points)
-        user_points["points"] += 1
-        
-        save_data(tasks, TASKS_FILE)
-        save_data(points, POINTS_FILE)
         
         yield event.plain_result(
             f"🎉 任务审核通过通知\n"
             f"任务ID：{task_id}\n"
             f"@{target_task['publisher_name']} 您发布的任务已完成\n"
-            f"@{target_task['accepted_by_name']} 获得1积分（当前：{user_points['points']}）"
+            f"@{target_task['accepted_by_name']} 获得1积分（当前：{target_task['points']}）"
         )
 
     # === 任务查询模块 ===
@@ -232,50 +390,56 @@ class AdvancedTaskSystem(Star):
     async def list_tasks(self, event: AstrMessageEvent):
         """查询用户相关任务"""
         user = self._get_user_info(event)
-        tasks = load_data(TASKS_FILE)
+        rows = await self._run(
+            self._fetch,
+            f"SELECT {_TASK_COLUMNS} FROM tasks "
+            "WHERE status != ? AND (publisher_id = ? OR accepted_by_id = ?) ORDER BY rowid",
+            (TaskStatus.COMPLETED, user["id"], user["id"]),
+            Task.from_row
+        )
         
-        my_tasks = []
-        for t in tasks:
-            if t["publisher_id"] == user["id"] and t["status"] != "completed":
-                my_tasks.append({
-                    "type": "我发布的",
-                    "id": t["task_id"],
-                    "status": t["status"],
-                    "content": t["content"]
-                })
-            if t.get("accepted_by_id") == user["id"] and t["status"] != "completed":
-                my_tasks.append({
-                    "type": "我接受的",
-                    "id": t["task_id"],
-                    "status": t["status"],
-                    "content": t["content"]
-                })
+        my_tasks = []  # (类型, 任务)
+        add_task = my_tasks.append
+        user_id = user["id"]
+        for t in rows:
+            if t.publisher_id == user_id:
+                add_task(("我发布的", t))
+            if t.accepted_by_id == user_id:
+                add_task(("我接受的", t))
         
         if not my_tasks:
             yield event.plain_result("📭 没有找到相关任务")
             return
             
+        get_label = self._get_status_label
+        item_fmt = _MY_TASK_ITEM_FMT
         response = ["📋 我的任务列表"]
-        status_map = {
-            "pending": "待接受",
-            "accepted": "进行中", 
-            "pending_review": "待审核"
-        }
-        for task in my_tasks:
-            response.append(
-                f"{task['type']} - {status_map[task['status']]}\n"
-                f"ID：{task['id']}\n"
-                f"内容：{task['content']}\n"
-                f"————————————"
-            )
+        for idx, (task_type, task) in enumerate(my_tasks, 1):
+            response.append(item_fmt(
+                type=task_type,
+                status=get_label(task.status),
+                task_id=task.task_id,
+                content=task.content
+            ))
+            # 任务较多时分条发送
+            if idx % MESSAGE_CHUNK_SIZE == 0:
+                yield event.plain_result("\n".join(response))
+                response = ["📋 我的任务列表（续）"]
             
-        yield event.plain_result("\n".join(response))
+        if len(response) > 1:
+            yield event.plain_result("\n".join(response))
 
     # === 全局任务列表 ===
     @filter.command("任务列表")
     async def list_all_tasks(self, event: AstrMessageEvent):
         """查看全平台任务状态"""
-        tasks = load_data(TASKS_FILE)
+        tasks = await self._run(
+            self._fetch,
+            "SELECT task_id, content, publisher_name, status, accepted_by_name "
+            "FROM tasks ORDER BY rowid",
+            (),
+            Task.from_row
+        )
         
         if not tasks:
             yield event.plain_result("📭 当前没有进行中的任务")
@@ -287,66 +451,75 @@ class AdvancedTaskSystem(Star):
             "🟠 待审核任务（等待验收）": [],
             "🔴 已完成任务（已通过审核）": []
         }
+        # 状态 -> 分组列表的append，替代逐个状态的if/elif判断
+        dispatch = dict(zip(TaskStatus, (group.append for group in task_groups.values())))
+        get_append = dispatch.get
+        status_label = _STATUS_LABEL
+        truncate = _truncate
+        item_fmt = _TASK_ITEM_FMT
         
         for task in tasks:
-            content_preview = (task["content"][:20] + "...") if len(task["content"]) > 20 else task["content"]
+            status = task.status
+            append = get_append(status)
+            if append is None:
+                continue
             
-            item = (
-                f"ID：{task['task_id']}\n"
-                f"内容：{content_preview}\n"
-                f"发布者：{task['publisher_name']}\n"
-                f"状态：{self._get_status_label(task['status'])}"
+            item = item_fmt(
+                task_id=task.task_id,
+                content=truncate(task.content, 20),
+                publisher=task.publisher_name,
+                status=status_label[status]
             )
             
-            if task["accepted_by_name"]:
-                item += f"\n执行者：{task['accepted_by_name']}"
+            if task.accepted_by_name:
+                item += f"\n执行者：{task.accepted_by_name}"
                 
-            status = task.get("status", "pending")
-            if status == "pending":
-                task_groups["🟢 可接受任务（未认领）"].append(item)
-            elif status == "accepted":
-                task_groups["🟡 进行中任务（已接受未完成）"].append(item)
-            elif status == "pending_review":
-                task_groups["🟠 待审核任务（等待验收）"].append(item)
-            elif status == "completed":
-                task_groups["🔴 已完成任务（已通过审核）"].append(item)
+            append(item)
 
+        # 按分组分条发送，单组任务过多时再按MESSAGE_CHUNK_SIZE拆分
         response = ["📜 全平台任务列表"]
         for group_name, group_tasks in task_groups.items():
-            if group_tasks:
-                response.append(f"\n{group_name}（共{len(group_tasks)}个）")
-                response.extend([f"▫️ {t}" for t in group_tasks])
+            if not group_tasks:
+                continue
+            header = f"{group_name}（共{len(group_tasks)}个）"
+            response.append(f"\n{header}" if response else header)
+            for start in range(0, len(group_tasks), MESSAGE_CHUNK_SIZE):
+                if start:
+                    # 后续消息重复分组标题，便于区分所属分组
+                    response.append(f"{group_name}（续）")
+                response.extend(f"▫️ {t}" for t in group_tasks[start:start + MESSAGE_CHUNK_SIZE])
+                yield event.plain_result("\n".join(response))
+                response = []
 
-        yield event.plain_result("\n".join(response))
+        if response:
+            yield event.plain_result("\n".join(response))
 
-    def _get_status_label(self, status: str) -> str:
+    def _get_status_label(self, status: TaskStatus) -> str:
         """获取状态标签"""
-        return {
-            "pending": "待接受",
-            "accepted": "进行中",
-            "pending_review": "待审核",
-            "completed": "已完成"
-        }.get(status, "未知状态")
+        if isinstance(status, TaskStatus):
+            return _STATUS_LABEL[status]
+        return "未知状态"
 
     # === 积分系统 ===
     @filter.command("我的积分")
     async def check_points(self, event: AstrMessageEvent):
         """查询用户积分"""
         user = self._get_user_info(event)
-        points_data = load_data(POINTS_FILE)
-        user_points = next(
-            (p for p in points_data if p["user_id"] == user["id"]),
-            {"points": 0}
+        rows = await self._run(
+            self._fetch, "SELECT points FROM points WHERE user_id = ?", (user["id"],)
         )
+        user_points = rows[0] if rows else {"points": 0}
         yield event.plain_result(f"🏅 当前积分：{user_points['points']}")
 
     @filter.command("积分榜")
     async def points_rank(self, event: AstrMessageEvent):
         """显示积分排行榜"""
-        points_data = load_data(POINTS_FILE)
-        sorted_points = sorted(points_data, 
-                             key=lambda x: x.get("points", 0), 
-                             reverse=True)[:10]
+        sorted_points = await self._run(
+            self._fetch,
+            f"SELECT {_POINTS_COLUMNS} FROM points ORDER BY points DESC, rowid LIMIT 10",
+            (),
+            UserPoints.from_row
+        )
         
         if not sorted_points:
             yield event.plain_result("📊 积分榜暂无数据")
@@ -354,8 +527,8 @@ class AdvancedTaskSystem(Star):
             
         rank_list = []
         for idx, p in enumerate(sorted_points, 1):
-            display_name = p.get("name", f"用户{p['user_id'][:6]}")
-            rank_list.append(f"{idx}. {display_name} - {p.get('points',0)}分")
+            display_name = p.name or f"用户{p.user_id[:6]}"
+            rank_list.append(f"{idx}. {display_name} - {p.points}分")
             
         yield event.plain_result(
             "🏆 积分排行榜TOP10：\n" + "\n".join(rank_list)